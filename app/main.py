@@ -1,26 +1,67 @@
 """
 FastAPI entrypoint for the Customer Support LLMOps service.
 
-This module configures middleware, registers routers for chat and feedback,
-and exposes health and root endpoints. It serves as the primary interface
-for launching and interacting with the LLM-powered API.
+This module configures middleware, registers routers for chat, feedback and
+interaction search, and exposes health and root endpoints. It serves as the
+primary interface for launching and interacting with the LLM-powered API.
+
+The application is built by `create_app`, whose lifespan initializes shared
+singletons (monitoring database, default prompt templates, chat session store)
+once per worker.
+Heavy SDKs such as OpenAI, LangChain and MLflow are only imported on first use.
 """
 
-import os
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import chat, feedback
-app = FastAPI(title='Customer Support LLMOps', description='An LLMOps implementation for customer support with monitoring and feedback', version='0.1.0')
-app.add_middleware(CORSMiddleware, allow_origins=['*'], allow_credentials=True, allow_methods=['*'], allow_headers=['*'])
-app.include_router(chat.router)
-app.include_router(feedback.router)
-
-@app.get('/')
-async def root():
-    """root - FastAPI app entrypoint. Registers routes and launches the service."""
-    return {'message': 'Customer Support LLMOps API'}
-
-@app.get('/health')
-async def health_check():
-    """health_check - FastAPI app entrypoint. Registers routes and launches the service."""
-    return {'status': 'healthy'}
\ No newline at end of file
+from app.prompts.templates import ensure_default_templates
+from app.routers import chat, feedback, interactions
+from app.services.session_store import get_session_store
+from app.utils.monitoring import get_monitor
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize shared resources once at startup and mark the app ready."""
+    app.state.ready = False
+    ensure_default_templates()
+    app.state.monitor = get_monitor()
+    app.state.session_store = get_session_store()
+    app.state.session_store.prune()
+    app.state.ready = True
+    yield
+    app.state.ready = False
+
+def create_app() -> FastAPI:
+    """Application factory - builds the FastAPI app with middleware, routers and probes."""
+    app = FastAPI(title='Customer Support LLMOps', description='An LLMOps implementation for customer support with monitoring and feedback', version='0.1.0', lifespan=lifespan)
+    app.state.ready = False
+    app.add_middleware(CORSMiddleware, allow_origins=['*'], allow_credentials=True, allow_methods=['*'], allow_headers=['*'])
+    app.include_router(chat.router)
+    app.include_router(feedback.router)
+    app.include_router(interactions.router)
+
+    @app.get('/')
+    async def root():
+        """root - FastAPI app entrypoint. Registers routes and launches the service."""
+        return {'message': 'Customer Support LLMOps API'}
+
+    @app.get('/health')
+    async def health_check():
+        """health_check - FastAPI app entrypoint. Registers routes and launches the service."""
+        return {'status': 'healthy'}
+
+    @app.get('/health/live')
+    async def liveness():
+        """Liveness probe - the process is up and serving requests."""
+        return {'status': 'alive'}
+
+    @app.get('/health/ready')
+    async def readiness(request: Request):
+        """Readiness probe - startup has finished and the monitoring database is reachable."""
+        if not request.app.state.ready:
+            raise HTTPException(status_code=503, detail='Service is starting up')
+        if not request.app.state.monitor.ping():
+            raise HTTPException(status_code=503, detail='Monitoring database unavailable')
+        return {'status': 'ready'}
+    return app
+app = create_app()
@@ -12,9 +12,7 @@ from datetime import datetime
 from pathlib import Path
 import hashlib
 PROMPTS_DIR = Path('prompts_repository')
-PROMPTS_DIR.mkdir(exist_ok=True)
 HISTORY_DIR = PROMPTS_DIR / 'history'
-HISTORY_DIR.mkdir(exist_ok=True)
 
 class PromptTemplate:
     """A versioned prompt template with metadata."""
@@ -51,6 +49,7 @@ class PromptRepository:
     @staticmethod
     def save(prompt_template):
         """Save a prompt template with version control."""
+        HISTORY_DIR.mkdir(parents=True, exist_ok=True)
         prompt_path = PROMPTS_DIR / f'{prompt_template.name}.json'
         with open(prompt_path, 'w') as f:
             json.dump(prompt_template.to_dict(), f, indent=2)
@@ -100,5 +99,12 @@ def initialize_default_templates():
     """initialize_default_templates - Manages prompt templates and versioned prompt sets for LLM execution."""
     customer_support = PromptTemplate(name='customer_support', template=CUSTOMER_SUPPORT_TEMPLATE, description='Customer support assistant prompt', metadata={'category': 'support', 'model': 'gpt-3.5-turbo'})
     PromptRepository.save(customer_support)
-if not (PROMPTS_DIR / 'customer_support.json').exists():
-    initialize_default_templates()
\ No newline at end of file
+
+def ensure_default_templates():
+    """Create the prompt repository and seed default templates if they are missing.
+
+    Called once from the application lifespan rather than at import time so that
+    importing this module has no filesystem side effects.
+    """
+    if not (PROMPTS_DIR / 'customer_support.json').exists():
+        initialize_default_templates()
\ No newline at end of file
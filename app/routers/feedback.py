@@ -6,12 +6,14 @@ log it via the monitoring system, and compute evaluation metrics such as average
 ratings, latency, and token usage over time.
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel, Field, ValidationError
+from starlette.concurrency import run_in_threadpool
 from typing import Dict, List, Optional, Any
-from app.utils.monitoring import LLMMonitor
+from app.utils.monitoring import LLMMonitor, get_monitor
 router = APIRouter(prefix='/feedback', tags=['feedback'])
-monitor = LLMMonitor()
+BULK_CHUNK_SIZE = 500
+MAX_LINE_BYTES = 64 * 1024
 
 class FeedbackRequest(BaseModel):
     """FeedbackRequest - Handles collection and routing of user feedback on LLM responses."""
@@ -25,6 +27,30 @@ class FeedbackResponse(BaseModel):
     feedback_id: int
     message: str = 'Feedback recorded successfully'
 
+class BulkFeedbackRow(BaseModel):
+    """BulkFeedbackRow - One NDJSON line of a bulk feedback upload."""
+    interaction_id: int
+    rating: int = Field(ge=1, le=5)
+    comment: Optional[str] = None
+    categories: Optional[List[str]] = None
+    source: Optional[str] = None
+
+class BulkFeedbackResult(BaseModel):
+    """BulkFeedbackResult - Outcome for a single line of a bulk feedback upload."""
+    line: int
+    status: str
+    feedback_id: Optional[int] = None
+    flagged: bool = False
+    error: Optional[str] = None
+
+class BulkFeedbackResponse(BaseModel):
+    """BulkFeedbackResponse - Per-row results and totals for a bulk feedback upload."""
+    received: int
+    created: int
+    duplicates: int
+    errors: int
+    results: List[BulkFeedbackResult]
+
 class MetricsResponse(BaseModel):
     """MetricsResponse - Handles collection and routing of user feedback on LLM responses."""
     total_count: int
@@ -36,7 +62,7 @@ class MetricsResponse(BaseModel):
     days: int
 
 @router.post('/', response_model=FeedbackResponse)
-async def submit_feedback(request: FeedbackRequest):
+async def submit_feedback(request: FeedbackRequest, monitor: LLMMonitor=Depends(get_monitor)):
     """Submit feedback for a specific interaction."""
     if request.rating < 1 or request.rating > 5:
         raise HTTPException(status_code=400, detail='Rating must be between 1 and 5')
@@ -45,8 +71,74 @@ async def submit_feedback(request: FeedbackRequest):
         monitor.flag_interaction(interaction_id=request.interaction_id, flag_type='low_rating', flag_reason=f'Low rating ({request.rating}/5)')
     return FeedbackResponse(feedback_id=feedback_id)
 
+@router.post('/bulk', response_model=BulkFeedbackResponse)
+async def submit_feedback_bulk(request: Request, source: str='bulk_import', monitor: LLMMonitor=Depends(get_monitor)):
+    """Submit feedback as streamed NDJSON, one FeedbackRequest-shaped object per line.
+
+    Lines are validated as they arrive and written in chunked transactions on a worker
+    thread. Lines longer than MAX_LINE_BYTES are rejected without being buffered. Feedback
+    that already exists for the same interaction and source is skipped as a duplicate.
+    """
+    results: List[Dict[str, Any]] = []
+    pending: List[Dict[str, Any]] = []
+    pending_lines: List[int] = []
+
+    async def flush():
+        """flush - Writes the pending chunk in one transaction off the event loop and records per-row results."""
+        batch, lines = (list(pending), list(pending_lines))
+        pending.clear()
+        pending_lines.clear()
+        for line, result in zip(lines, await run_in_threadpool(monitor.log_feedback_batch, batch)):
+            results.append({'line': line, **result})
+
+    async def handle(line_no: int, raw: bytes, oversized: bool):
+        """handle - Validates one NDJSON line and queues it for the next chunk."""
+        if oversized:
+            results.append({'line': line_no, 'status': 'error', 'error': f'Line exceeds {MAX_LINE_BYTES} bytes'})
+            return
+        if not raw.strip():
+            return
+        try:
+            row = BulkFeedbackRow.model_validate_json(raw)
+        except ValidationError as e:
+            results.append({'line': line_no, 'status': 'error', 'error': '; '.join((err['msg'] for err in e.errors()))})
+            return
+        pending.append({**row.model_dump(), 'source': row.source or source})
+        pending_lines.append(line_no)
+        if len(pending) >= BULK_CHUNK_SIZE:
+            await flush()
+    line_no = 0
+    partial = bytearray()
+    oversized = False
+    async for chunk in request.stream():
+        start = 0
+        while True:
+            end = chunk.find(b'\n', start)
+            piece = chunk[start:] if end == -1 else chunk[start:end]
+            if not oversized:
+                if len(partial) + len(piece) > MAX_LINE_BYTES:
+                    oversized = True
+                    partial.clear()
+                else:
+                    partial += piece
+            if end == -1:
+                break
+            line_no += 1
+            await handle(line_no, bytes(partial), oversized)
+            partial.clear()
+            oversized = False
+            start = end + 1
+    if partial or oversized:
+        line_no += 1
+        await handle(line_no, bytes(partial), oversized)
+    if pending:
+        await flush()
+    results.sort(key=lambda r: r['line'])
+    statuses = [r['status'] for r in results]
+    return BulkFeedbackResponse(received=len(results), created=statuses.count('created'), duplicates=statuses.count('duplicate'), errors=statuses.count('error'), results=results)
+
 @router.get('/metrics', response_model=MetricsResponse)
-async def get_metrics(days: int=7):
+async def get_metrics(days: int=7, monitor: LLMMonitor=Depends(get_monitor)):
     """Get summary metrics for recent interactions."""
     if days < 1 or days > 30:
         raise HTTPException(status_code=400, detail='Days must be between 1 and 30')
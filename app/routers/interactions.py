@@ -0,0 +1,37 @@
+"""
+Provides search endpoints for investigating logged LLM interactions.
+
+This module exposes a full-text search over prompts, responses and feedback comments
+backed by the SQLite FTS5 index in the monitoring database. Results are ranked by BM25,
+include highlighted snippets, and can be filtered by date range, model and flagged status.
+"""
+
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel
+from typing import List, Optional
+from app.utils.monitoring import LLMMonitor, get_monitor
+router = APIRouter(prefix='/interactions', tags=['interactions'])
+
+class SearchResult(BaseModel):
+    """SearchResult - A ranked interaction match with highlighted snippets."""
+    interaction_id: int
+    timestamp: str
+    session_id: Optional[str]
+    model: Optional[str]
+    prompt_name: Optional[str]
+    prompt_version: Optional[str]
+    flagged: bool
+    score: float
+    prompt_snippet: str
+    response_snippet: str
+    comment_snippet: str
+
+@router.get('/search', response_model=List[SearchResult])
+async def search_interactions(q: str=Query(..., min_length=1), start_date: Optional[datetime]=None, end_date: Optional[datetime]=None, model: Optional[str]=None, flagged: Optional[bool]=None, limit: int=20, monitor: LLMMonitor=Depends(get_monitor)):
+    """Search interactions by prompt, response and feedback comment text."""
+    if limit < 1 or limit > 100:
+        raise HTTPException(status_code=400, detail='Limit must be between 1 and 100')
+    if not monitor.fts_enabled:
+        raise HTTPException(status_code=503, detail='Full-text search is not available')
+    return monitor.search_interactions(query=q, start_date=start_date.isoformat() if start_date else None, end_date=end_date.isoformat() if end_date else None, model=model, flagged=flagged, limit=limit)
@@ -6,19 +6,27 @@ and stores them in a persistent Chroma vectorstore. It supports similarity-based
 LLM responses with relevant context.
 """
 
-from langchain.embeddings import OpenAIEmbeddings
-from langchain.vectorstores import Chroma
-from langchain.text_splitter import RecursiveCharacterTextSplitter
 import json
-with open('data/kb/support_articles.json', 'r') as f:
-    kb_articles = json.load(f)
-documents = [f"Title: {a['title']}\nContent: {a['content']}" for a in kb_articles]
-text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-chunks = text_splitter.split_texts(documents)
-embeddings = OpenAIEmbeddings()
-vectorstore = Chroma.from_texts(chunks, embeddings, persist_directory='./chroma_db')
+KB_PATH = 'data/kb/support_articles.json'
+_vectorstore = None
+
+def get_vectorstore():
+    """Build the KB vectorstore on first use; LangChain is imported lazily to keep startup cheap."""
+    global _vectorstore
+    if _vectorstore is None:
+        from langchain.embeddings import OpenAIEmbeddings
+        from langchain.vectorstores import Chroma
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+        with open(KB_PATH, 'r') as f:
+            kb_articles = json.load(f)
+        documents = [f"Title: {a['title']}\nContent: {a['content']}" for a in kb_articles]
+        text_splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+        chunks = text_splitter.split_texts(documents)
+        embeddings = OpenAIEmbeddings()
+        _vectorstore = Chroma.from_texts(chunks, embeddings, persist_directory='./chroma_db')
+    return _vectorstore
 
 def retrieve_context(query, k=3):
-    """retrieve_context - TODO: Add description."""
-    results = vectorstore.similarity_search(query, k=k)
+    """Return the top-k KB chunks most similar to the query."""
+    results = get_vectorstore().similarity_search(query, k=k)
     return '\n\n'.join([doc.page_content for doc in results])
\ No newline at end of file
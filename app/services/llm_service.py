@@ -11,14 +11,21 @@ import time
 import uuid
 import logging
 from typing import Dict, List, Optional, Any
-import openai
-from openai import OpenAI
 from app.prompts.templates import PromptRepository
-from app.utils.monitoring import LLMMonitor
+from app.services.session_store import get_session_store
+from app.utils.monitoring import get_monitor
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
-client = OpenAI(api_key=os.getenv('OPENAI_API_KEY', ''))
-monitor = LLMMonitor()
+SYSTEM_MESSAGE = 'You are a helpful assistant.'
+_client = None
+
+def get_client():
+    """Return the shared OpenAI client, importing the SDK on first use."""
+    global _client
+    if _client is None:
+        from openai import OpenAI
+        _client = OpenAI(api_key=os.getenv('OPENAI_API_KEY', ''))
+    return _client
 
 class LLMService:
     """Service for handling LLM requests with monitoring and metrics."""
@@ -33,9 +40,11 @@ class LLMService:
             logger.error(f'Prompt template not found: {prompt_name}')
             return {'error': 'Prompt template not found', 'session_id': session_id}
         formatted_prompt = prompt_template.format(**prompt_params)
+        session_store = get_session_store()
+        messages = session_store.build_messages(session_id, SYSTEM_MESSAGE, formatted_prompt)
         start_time = time.time()
         try:
-            response = client.chat.completions.create(model=model, messages=[{'role': 'system', 'content': 'You are a helpful assistant.'}, {'role': 'user', 'content': formatted_prompt}], temperature=temperature, max_tokens=max_tokens)
+            response = get_client().chat.completions.create(model=model, messages=messages, temperature=temperature, max_tokens=max_tokens)
             response_text = response.choices[0].message.content
             tokens_input = response.usage.prompt_tokens
             tokens_output = response.usage.completion_tokens
@@ -43,5 +52,6 @@ class LLMService:
             logger.error(f'LLM request failed: {str(e)}')
             return {'error': str(e), 'session_id': session_id}
         latency_ms = int((time.time() - start_time) * 1000)
-        interaction_id = monitor.log_interaction(session_id=session_id, prompt_name=prompt_name, prompt_version=prompt_template.version, prompt_text=formatted_prompt, response_text=response_text, tokens_input=tokens_input, tokens_output=tokens_output, latency_ms=latency_ms, model=model, temperature=temperature, metadata=metadata or {})
+        session_store.append_turn(session_id, prompt_params.get('question', formatted_prompt), response_text)
+        interaction_id = get_monitor().log_interaction(session_id=session_id, prompt_name=prompt_name, prompt_version=prompt_template.version, prompt_text=formatted_prompt, response_text=response_text, tokens_input=tokens_input, tokens_output=tokens_output, latency_ms=latency_ms, model=model, temperature=temperature, metadata=metadata or {})
         return {'response': response_text, 'interaction_id': interaction_id, 'session_id': session_id, 'latency_ms': latency_ms, 'tokens_input': tokens_input, 'tokens_output': tokens_output, 'prompt_version': prompt_template.version}
\ No newline at end of file
@@ -0,0 +1,281 @@
+"""
+Server-side conversation memory for multi-turn chat sessions.
+
+This module keeps per-session chat history in a bounded in-memory LRU (max sessions,
+idle TTL and a total byte budget), optionally persisted to SQLite so history survives
+restarts and is shared across workers. It builds the `messages` list sent to the LLM
+from past turns and compacts older turns into a rolling summary once the history
+crosses a token threshold, keeping per-turn input tokens roughly flat.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Any
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+MAX_SESSIONS = int(os.getenv('SESSION_MAX_SESSIONS', '10000'))
+SESSION_TTL_SECONDS = int(os.getenv('SESSION_TTL_SECONDS', '3600'))
+MAX_BYTES = int(os.getenv('SESSION_MAX_BYTES', str(64 * 1024 * 1024)))
+SUMMARY_THRESHOLD_TOKENS = int(os.getenv('SESSION_SUMMARY_THRESHOLD_TOKENS', '800'))
+KEEP_RECENT_TURNS = int(os.getenv('SESSION_KEEP_RECENT_TURNS', '2'))
+SESSION_DB_PATH = os.getenv('SESSION_DB_PATH')
+PRUNE_INTERVAL_SECONDS = int(os.getenv('SESSION_PRUNE_INTERVAL_SECONDS', '300'))
+_session_store: Optional['SessionStore'] = None
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token) used for compaction decisions."""
+    return len(text) // 4 + 1 if text else 0
+
+def extractive_summary(previous_summary: str, turns: List[Dict[str, str]], max_chars: int=1200) -> str:
+    """Fold turns into the running summary by keeping the first sentence of each message."""
+
+    def first_sentence(text: str) -> str:
+        """first_sentence - Returns the leading sentence of a message, capped at 200 characters."""
+        text = ' '.join(text.split())
+        for stop in ('. ', '? ', '! '):
+            idx = text.find(stop)
+            if idx != -1:
+                text = text[:idx + 1]
+                break
+        return text[:200]
+    lines = previous_summary.split('\n') if previous_summary else []
+    for turn in turns:
+        lines.append(f"User asked: {first_sentence(turn['user'])} Assistant answered: {first_sentence(turn['assistant'])}")
+    while len(lines) > 1 and len('\n'.join(lines)) > max_chars:
+        lines.pop(0)
+    return '\n'.join(lines)[:max_chars]
+
+class SessionHistory:
+    """Conversation state for one session: a rolling summary plus the most recent turns."""
+
+    def __init__(self, summary: str='', turns: Optional[List[Dict[str, str]]]=None, last_access: Optional[float]=None, version: int=0):
+        """__init__ - Holds the rolling summary, recent turns and persisted row version for a session."""
+        self.summary = summary
+        self.turns = turns or []
+        self.last_access = last_access or time.time()
+        self.version = version
+
+    def size_bytes(self) -> int:
+        """Approximate memory footprint of the stored text."""
+        return len(self.summary.encode()) + sum((len(t['user'].encode()) + len(t['assistant'].encode()) for t in self.turns))
+
+    def history_tokens(self) -> int:
+        """Estimated tokens the summary and stored turns add to a request."""
+        return estimate_tokens(self.summary) + sum((estimate_tokens(t['user']) + estimate_tokens(t['assistant']) for t in self.turns))
+
+class SessionStore:
+    """Bounded LRU store of chat histories with TTL, byte budget and optional SQLite persistence.
+
+    When a database is configured it is the source of truth: reads revalidate the cached
+    copy against the row version and writes re-read the row inside a write transaction,
+    so several workers can share a session without losing turns.
+    """
+
+    def __init__(self, max_sessions: int=MAX_SESSIONS, ttl_seconds: int=SESSION_TTL_SECONDS, max_bytes: int=MAX_BYTES, summary_threshold_tokens: int=SUMMARY_THRESHOLD_TOKENS, keep_recent_turns: int=KEEP_RECENT_TURNS, db_path: Optional[str]=SESSION_DB_PATH, summarizer: Callable[[str, List[Dict[str, str]]], str]=extractive_summary, prune_interval_seconds: int=PRUNE_INTERVAL_SECONDS):
+        """__init__ - Configures eviction limits, compaction and optional persistence."""
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.summary_threshold_tokens = summary_threshold_tokens
+        self.keep_recent_turns = keep_recent_turns
+        self.db_path = db_path
+        self.summarizer = summarizer
+        self.prune_interval_seconds = prune_interval_seconds
+        self._sessions: 'OrderedDict[str, SessionHistory]' = OrderedDict()
+        self._bytes = 0
+        self._last_prune = time.time()
+        self._lock = threading.Lock()
+        if self.db_path:
+            self.setup_database()
+
+    def setup_database(self):
+        """Set up the session persistence table."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('\n        CREATE TABLE IF NOT EXISTS chat_sessions (\n            session_id TEXT PRIMARY KEY,\n            summary TEXT,\n            turns TEXT,\n            last_access REAL,\n            version INTEGER DEFAULT 0\n        )\n        ')
+        columns = [row[1] for row in cursor.execute('PRAGMA table_info(chat_sessions)')]
+        if 'version' not in columns:
+            cursor.execute('ALTER TABLE chat_sessions ADD COLUMN version INTEGER DEFAULT 0')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_chat_sessions_last_access ON chat_sessions (last_access)')
+        conn.commit()
+        conn.close()
+
+    def _load(self, cursor: sqlite3.Cursor, session_id: str) -> Optional[SessionHistory]:
+        """Load a session row, ignoring rows older than the TTL."""
+        cursor.execute('SELECT summary, turns, last_access, version FROM chat_sessions WHERE session_id = ? AND last_access >= ?', (session_id, time.time() - self.ttl_seconds))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return SessionHistory(summary=row[0] or '', turns=json.loads(row[1] or '[]'), last_access=row[2], version=row[3] or 0)
+
+    def _drop(self, session_id: str):
+        """Remove a session from memory and release its bytes."""
+        history = self._sessions.pop(session_id, None)
+        if history is not None:
+            self._bytes -= history.size_bytes()
+
+    def _cache(self, session_id: str, history: SessionHistory):
+        """Store a session as the most recently used entry and enforce the limits."""
+        self._drop(session_id)
+        self._sessions[session_id] = history
+        self._bytes += history.size_bytes()
+        self._evict(keep=session_id)
+
+    def _fit(self, session_id: str, history: SessionHistory):
+        """Shrink a session that alone exceeds the byte budget instead of evicting it.
+
+        Older turns are folded into the summary first; if the session is still too large
+        the summary is dropped and the latest turn is truncated.
+        """
+        if history.size_bytes() <= self.max_bytes:
+            return
+        if len(history.turns) > 1:
+            history.summary = self.summarizer(history.summary, history.turns[:-1])
+            history.turns = history.turns[-1:]
+        if history.size_bytes() <= self.max_bytes:
+            return
+        logger.warning(f'Session {session_id} exceeds the {self.max_bytes} byte budget; truncating its history')
+        history.summary = ''
+        budget = self.max_bytes // 2
+        history.turns = [{role: text.encode()[:budget].decode(errors='ignore') for role, text in turn.items()} for turn in history.turns]
+
+    def _evict(self, keep: Optional[str]=None):
+        """Evict expired sessions, then least recently used ones until within limits.
+
+        `keep` is the session just written; it is never evicted to make room for itself.
+        """
+        cutoff = time.time() - self.ttl_seconds
+        for session_id in list(self._sessions):
+            history = self._sessions[session_id]
+            if history.last_access >= cutoff and len(self._sessions) <= self.max_sessions and self._bytes <= self.max_bytes:
+                break
+            if session_id != keep:
+                self._drop(session_id)
+
+    def get(self, session_id: str) -> Optional[SessionHistory]:
+        """Return a live session, revalidating the cached copy against SQLite when configured."""
+        with self._lock:
+            history = self._sessions.get(session_id)
+            if history is not None and history.last_access < time.time() - self.ttl_seconds:
+                self._drop(session_id)
+                history = None
+            if self.db_path:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+                cursor.execute('SELECT version FROM chat_sessions WHERE session_id = ? AND last_access >= ?', (session_id, time.time() - self.ttl_seconds))
+                row = cursor.fetchone()
+                if row is None:
+                    self._drop(session_id)
+                    history = None
+                elif history is None or history.version != row[0]:
+                    history = self._load(cursor, session_id)
+                conn.close()
+            if history is not None:
+                history.last_access = time.time()
+                self._cache(session_id, history)
+            return history
+
+    def build_messages(self, session_id: str, system_message: str, prompt: str) -> List[Dict[str, str]]:
+        """Build the chat `messages` list from the rolling summary, recent turns and the new prompt."""
+        messages = [{'role': 'system', 'content': system_message}]
+        history = self.get(session_id)
+        if history is not None:
+            if history.summary:
+                messages.append({'role': 'system', 'content': f'Summary of the earlier conversation:\n{history.summary}'})
+            for turn in history.turns:
+                messages.append({'role': 'user', 'content': turn['user']})
+                messages.append({'role': 'assistant', 'content': turn['assistant']})
+        messages.append({'role': 'user', 'content': prompt})
+        return messages
+
+    def _add_turn(self, history: SessionHistory, user_message: str, assistant_message: str):
+        """Append a turn and fold older turns into the summary past the token threshold."""
+        history.turns.append({'user': user_message, 'assistant': assistant_message})
+        if history.history_tokens() > self.summary_threshold_tokens and len(history.turns) > self.keep_recent_turns:
+            split = len(history.turns) - self.keep_recent_turns
+            history.summary = self.summarizer(history.summary, history.turns[:split])
+            history.turns = history.turns[split:]
+        history.last_access = time.time()
+
+    def append_turn(self, session_id: str, user_message: str, assistant_message: str) -> SessionHistory:
+        """Record a completed turn, compacting older turns into the summary past the token threshold.
+
+        With SQLite configured the row is re-read and rewritten inside one `BEGIN IMMEDIATE`
+        transaction, so concurrent appends from other workers are never overwritten.
+        """
+        with self._lock:
+            if not self.db_path:
+                history = self._sessions.get(session_id)
+                if history is None or history.last_access < time.time() - self.ttl_seconds:
+                    history = SessionHistory()
+                self._drop(session_id)
+                self._add_turn(history, user_message, assistant_message)
+                self._fit(session_id, history)
+                self._cache(session_id, history)
+                return history
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            cursor = conn.cursor()
+            try:
+                cursor.execute('BEGIN IMMEDIATE')
+                history = self._load(cursor, session_id) or SessionHistory()
+                self._add_turn(history, user_message, assistant_message)
+                self._fit(session_id, history)
+                history.version += 1
+                cursor.execute('\n                INSERT INTO chat_sessions (session_id, summary, turns, last_access, version)\n                VALUES (?, ?, ?, ?, ?)\n                ON CONFLICT(session_id) DO UPDATE SET\n                    summary = excluded.summary,\n                    turns = excluded.turns,\n                    last_access = excluded.last_access,\n                    version = excluded.version\n                ', (session_id, history.summary, json.dumps(history.turns), history.last_access, history.version))
+                if time.time() - self._last_prune >= self.prune_interval_seconds:
+                    self._prune_rows(cursor)
+                cursor.execute('COMMIT')
+            except Exception:
+                if conn.in_transaction:
+                    cursor.execute('ROLLBACK')
+                raise
+            finally:
+                conn.close()
+            self._cache(session_id, history)
+            return history
+
+    def _prune_rows(self, cursor: sqlite3.Cursor) -> int:
+        """Delete persisted sessions idle for longer than the TTL."""
+        cursor.execute('DELETE FROM chat_sessions WHERE last_access < ?', (time.time() - self.ttl_seconds,))
+        self._last_prune = time.time()
+        if cursor.rowcount:
+            logger.info(f'Pruned {cursor.rowcount} expired chat sessions')
+        return cursor.rowcount
+
+    def prune(self) -> int:
+        """Drop expired sessions from memory and SQLite; returns the number of rows deleted."""
+        with self._lock:
+            self._evict()
+            if not self.db_path:
+                return 0
+            conn = sqlite3.connect(self.db_path)
+            deleted = self._prune_rows(conn.cursor())
+            conn.commit()
+            conn.close()
+            return deleted
+
+    def clear(self, session_id: str):
+        """Forget a session in memory and in SQLite."""
+        with self._lock:
+            self._drop(session_id)
+            if self.db_path:
+                conn = sqlite3.connect(self.db_path)
+                conn.execute('DELETE FROM chat_sessions WHERE session_id = ?', (session_id,))
+                conn.commit()
+                conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Current occupancy of the in-memory store."""
+        return {'sessions': len(self._sessions), 'bytes': self._bytes, 'max_sessions': self.max_sessions, 'max_bytes': self.max_bytes}
+
+def get_session_store() -> SessionStore:
+    """Return the process-wide SessionStore, creating it on first use."""
+    global _session_store
+    if _session_store is None:
+        _session_store = SessionStore()
+    return _session_store
@@ -0,0 +1,25 @@
+"""
+Command-line backfill for the interaction full-text search index.
+
+Rebuilds the FTS5 index in the monitoring database from the existing `interactions`
+and `feedback` rows. Run it once after upgrading a database that predates the index,
+or whenever the index needs to be rebuilt from scratch.
+
+Usage:
+    python -m app.utils.backfill_search_index [--db-path monitoring.db]
+"""
+
+import argparse
+import time
+from app.utils.monitoring import DB_PATH, LLMMonitor
+
+def main():
+    """main - Rebuilds the search index and reports how many interactions were indexed."""
+    parser = argparse.ArgumentParser(description='Backfill the interaction full-text search index.')
+    parser.add_argument('--db-path', default=DB_PATH)
+    args = parser.parse_args()
+    start_time = time.time()
+    indexed = LLMMonitor(db_path=args.db_path).rebuild_search_index()
+    print(f'Indexed {indexed} interactions in {time.time() - start_time:.2f}s')
+if __name__ == '__main__':
+    main()
@@ -6,15 +6,16 @@ It supports both structured experiment logging and ad hoc tracking of live LLM i
 auditability, reproducibility, and performance analysis.
 """
 
-import mlflow
-import mlflow.pyfunc
 import os
+from typing import Dict, Any, Optional
 
 class MLflowTracker:
     """Integration with MLflow for experiment tracking."""
 
     def __init__(self, experiment_name='customer-support-llm'):
         """__init__ - Integrates MLflow for experiment tracking and model evaluation."""
+        import mlflow
+        self.mlflow = mlflow
         mlflow.set_tracking_uri(os.getenv('MLFLOW_TRACKING_URI', 'http://localhost:5000'))
         try:
             self.experiment_id = mlflow.create_experiment(experiment_name)
@@ -23,6 +24,7 @@ class MLflowTracker:
 
     def log_prompt_test(self, prompt_name: str, prompt_version: str, metrics: Dict[str, float], params: Dict[str, Any], artifacts: Optional[Dict[str, str]]=None) -> str:
         """Log a prompt test to MLflow."""
+        mlflow = self.mlflow
         with mlflow.start_run(experiment_id=self.experiment_id) as run:
             for key, value in params.items():
                 mlflow.log_param(key, value)
@@ -36,6 +38,7 @@ class MLflowTracker:
 
     def log_interaction(self, interaction_data: Dict[str, Any]) -> str:
         """Log an individual interaction to MLflow."""
+        mlflow = self.mlflow
         with mlflow.start_run(experiment_id=self.experiment_id) as run:
             mlflow.log_param('prompt_name', interaction_data.get('prompt_name'))
             mlflow.log_param('prompt_version', interaction_data.get('prompt_version'))
@@ -14,6 +14,7 @@ from typing import Dict, Any, List, Optional
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 DB_PATH = 'monitoring.db'
+_monitor: Optional['LLMMonitor'] = None
 
 class LLMMonitor:
     """Monitor and log LLM interactions and metrics."""
@@ -21,6 +22,7 @@ class LLMMonitor:
     def __init__(self, db_path: str=DB_PATH):
         """__init__ - Handles monitoring and metrics logging for LLM interactions."""
         self.db_path = db_path
+        self.fts_enabled = False
         self.setup_database()
 
     def setup_database(self):
@@ -30,8 +32,79 @@ class LLMMonitor:
         cursor.execute('\n        CREATE TABLE IF NOT EXISTS interactions (\n            id INTEGER PRIMARY KEY AUTOINCREMENT,\n            timestamp TEXT,\n            session_id TEXT,\n            prompt_name TEXT,\n            prompt_version TEXT,\n            prompt_text TEXT,\n            response_text TEXT,\n            tokens_input INTEGER,\n            tokens_output INTEGER,\n            latency_ms INTEGER,\n            model TEXT,\n            temperature REAL,\n            flagged BOOLEAN DEFAULT 0,\n            metadata TEXT\n        )\n        ')
         cursor.execute('\n        CREATE TABLE IF NOT EXISTS feedback (\n            id INTEGER PRIMARY KEY AUTOINCREMENT,\n            interaction_id INTEGER,\n            rating INTEGER,\n            comment TEXT,\n            categories TEXT,\n            timestamp TEXT,\n            FOREIGN KEY (interaction_id) REFERENCES interactions (id)\n        )\n        ')
         cursor.execute('\n        CREATE TABLE IF NOT EXISTS flags (\n            id INTEGER PRIMARY KEY AUTOINCREMENT,\n            interaction_id INTEGER,\n            flag_type TEXT,\n            flag_reason TEXT,\n            timestamp TEXT,\n            FOREIGN KEY (interaction_id) REFERENCES interactions (id)\n        )\n        ')
+        columns = [row[1] for row in cursor.execute('PRAGMA table_info(feedback)')]
+        if 'source' not in columns:
+            cursor.execute('ALTER TABLE feedback ADD COLUMN source TEXT')
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_feedback_interaction_source ON feedback (interaction_id, source) WHERE source IS NOT NULL')
         conn.commit()
         conn.close()
+        self.setup_search_index()
+
+    def setup_search_index(self):
+        """Create the FTS5 index over prompts, responses and feedback comments, kept in sync by triggers."""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        try:
+            cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS interactions_fts USING fts5(prompt_text, response_text, comments, tokenize='porter unicode61')")
+        except sqlite3.OperationalError as e:
+            conn.close()
+            logger.warning(f'FTS5 unavailable, interaction search disabled: {str(e)}')
+            return
+        cursor.execute("\n        CREATE TRIGGER IF NOT EXISTS interactions_fts_insert AFTER INSERT ON interactions BEGIN\n            INSERT INTO interactions_fts (rowid, prompt_text, response_text, comments)\n            VALUES (new.id, new.prompt_text, new.response_text, '');\n        END\n        ")
+        cursor.execute('\n        CREATE TRIGGER IF NOT EXISTS interactions_fts_update AFTER UPDATE OF prompt_text, response_text ON interactions BEGIN\n            UPDATE interactions_fts SET prompt_text = new.prompt_text, response_text = new.response_text\n            WHERE rowid = new.id;\n        END\n        ')
+        cursor.execute('\n        CREATE TRIGGER IF NOT EXISTS interactions_fts_delete AFTER DELETE ON interactions BEGIN\n            DELETE FROM interactions_fts WHERE rowid = old.id;\n        END\n        ')
+        cursor.execute("\n        CREATE TRIGGER IF NOT EXISTS feedback_fts_insert AFTER INSERT ON feedback\n        WHEN new.comment IS NOT NULL AND new.comment != '' BEGIN\n            UPDATE interactions_fts SET comments = trim(comments || ' ' || new.comment)\n            WHERE rowid = new.interaction_id;\n        END\n        ")
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_feedback_interaction ON feedback (interaction_id)')
+        comments_sql = "COALESCE((SELECT group_concat(f.comment, ' ') FROM feedback f WHERE f.interaction_id = {0} AND f.comment IS NOT NULL AND f.comment != ''), '')"
+        cursor.execute(f'\n        CREATE TRIGGER IF NOT EXISTS feedback_fts_update AFTER UPDATE OF comment, interaction_id ON feedback BEGIN\n            UPDATE interactions_fts SET comments = {comments_sql.format("old.interaction_id")}\n            WHERE rowid = old.interaction_id;\n            UPDATE interactions_fts SET comments = {comments_sql.format("new.interaction_id")}\n            WHERE rowid = new.interaction_id;\n        END\n        ')
+        cursor.execute(f'\n        CREATE TRIGGER IF NOT EXISTS feedback_fts_delete AFTER DELETE ON feedback BEGIN\n            UPDATE interactions_fts SET comments = {comments_sql.format("old.interaction_id")}\n            WHERE rowid = old.interaction_id;\n        END\n        ')
+        conn.commit()
+        conn.close()
+        self.fts_enabled = True
+
+    def rebuild_search_index(self) -> int:
+        """Backfill the FTS5 index from the interactions and feedback tables."""
+        if not self.fts_enabled:
+            raise RuntimeError('FTS5 is not available in this SQLite build')
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('DELETE FROM interactions_fts')
+        cursor.execute("\n            INSERT INTO interactions_fts (rowid, prompt_text, response_text, comments)\n            SELECT i.id, i.prompt_text, i.response_text,\n                   COALESCE((SELECT group_concat(f.comment, ' ') FROM feedback f\n                             WHERE f.interaction_id = i.id AND f.comment IS NOT NULL AND f.comment != ''), '')\n            FROM interactions i\n            ")
+        indexed = cursor.rowcount
+        cursor.execute("INSERT INTO interactions_fts (interactions_fts) VALUES ('optimize')")
+        conn.commit()
+        conn.close()
+        logger.info(f'Rebuilt search index with {indexed} interactions')
+        return indexed
+
+    def search_interactions(self, query: str, start_date: Optional[str]=None, end_date: Optional[str]=None, model: Optional[str]=None, flagged: Optional[bool]=None, limit: int=20) -> List[Dict[str, Any]]:
+        """Full-text search over interactions, ranked by BM25 with highlighted snippets."""
+        if not self.fts_enabled:
+            raise RuntimeError('FTS5 is not available in this SQLite build')
+        match = ' '.join(('"' + term.replace('"', '""') + '"' for term in query.split()))
+        if not match:
+            return []
+        filters = ['interactions_fts MATCH ?']
+        params: List[Any] = [match]
+        if start_date:
+            filters.append('i.timestamp >= ?')
+            params.append(start_date)
+        if end_date:
+            filters.append('i.timestamp <= ?')
+            params.append(end_date)
+        if model:
+            filters.append('i.model = ?')
+            params.append(model)
+        if flagged is not None:
+            filters.append('i.flagged = ?')
+            params.append(1 if flagged else 0)
+        params.append(limit)
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute(f"\n            SELECT i.id, i.timestamp, i.session_id, i.model, i.prompt_name, i.prompt_version, i.flagged,\n                   bm25(interactions_fts) AS rank,\n                   snippet(interactions_fts, 0, '[', ']', '...', 16),\n                   snippet(interactions_fts, 1, '[', ']', '...', 16),\n                   snippet(interactions_fts, 2, '[', ']', '...', 16)\n            FROM interactions_fts\n            JOIN interactions i ON i.id = interactions_fts.rowid\n            WHERE {' AND '.join(filters)}\n            ORDER BY rank\n            LIMIT ?\n            ", params)
+        rows = cursor.fetchall()
+        conn.close()
+        return [{'interaction_id': row[0], 'timestamp': row[1], 'session_id': row[2], 'model': row[3], 'prompt_name': row[4], 'prompt_version': row[5], 'flagged': bool(row[6]), 'score': round(-row[7], 4), 'prompt_snippet': row[8], 'response_snippet': row[9], 'comment_snippet': row[10]} for row in rows]
 
     def log_interaction(self, session_id: str, prompt_name: str, prompt_version: str, prompt_text: str, response_text: str, tokens_input: int, tokens_output: int, latency_ms: int, model: str, temperature: float=0.7, metadata: Optional[Dict[str, Any]]=None) -> int:
         """Log an LLM interaction to the database."""
@@ -55,6 +128,64 @@ class LLMMonitor:
         logger.info(f'Logged feedback {feedback_id} for interaction {interaction_id}')
         return feedback_id
 
+    def log_feedback_batch(self, rows: List[Dict[str, Any]], low_rating_threshold: int=2) -> List[Dict[str, Any]]:
+        """Log a batch of sourced feedback and low-rating flags in a single transaction.
+
+        Each row needs `interaction_id`, `rating` and `source`, plus optional `comment` and
+        `categories`. Rows for unknown interactions are rejected and rows whose
+        (interaction_id, source) pair already exists are skipped. Returns one result per row,
+        in input order, with `status` set to `created`, `duplicate` or `error`.
+        """
+        if not rows:
+            return []
+        interaction_ids = sorted({row['interaction_id'] for row in rows})
+        placeholders = ', '.join(('?' for _ in interaction_ids))
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        cursor = conn.cursor()
+        try:
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute(f'SELECT id FROM interactions WHERE id IN ({placeholders})', interaction_ids)
+            known = {row[0] for row in cursor.fetchall()}
+            cursor.execute(f'SELECT interaction_id, source FROM feedback WHERE source IS NOT NULL AND interaction_id IN ({placeholders})', interaction_ids)
+            seen = set(cursor.fetchall())
+            results = []
+            feedback_rows = []
+            flag_rows = []
+            timestamp = datetime.now().isoformat()
+            for row in rows:
+                key = (row['interaction_id'], row['source'])
+                if row['interaction_id'] not in known:
+                    results.append({'status': 'error', 'error': f"Interaction {row['interaction_id']} not found"})
+                    continue
+                if key in seen:
+                    results.append({'status': 'duplicate'})
+                    continue
+                seen.add(key)
+                feedback_rows.append((row['interaction_id'], row['rating'], row.get('comment'), json.dumps(row.get('categories') or []), timestamp, row['source']))
+                flagged = row['rating'] <= low_rating_threshold
+                if flagged:
+                    flag_rows.append((row['interaction_id'], 'low_rating', f"Low rating ({row['rating']}/5)", timestamp))
+                results.append({'status': 'created', 'key': key, 'flagged': flagged})
+            cursor.executemany('\n                INSERT INTO feedback\n                (interaction_id, rating, comment, categories, timestamp, source)\n                VALUES (?, ?, ?, ?, ?, ?)\n                ', feedback_rows)
+            if flag_rows:
+                cursor.executemany('UPDATE interactions SET flagged = 1 WHERE id = ?', sorted({(r[0],) for r in flag_rows}))
+                cursor.executemany('\n                    INSERT INTO flags\n                    (interaction_id, flag_type, flag_reason, timestamp)\n                    VALUES (?, ?, ?, ?)\n                    ', flag_rows)
+            cursor.execute(f'SELECT interaction_id, source, id FROM feedback WHERE source IS NOT NULL AND interaction_id IN ({placeholders})', interaction_ids)
+            feedback_ids = {(row[0], row[1]): row[2] for row in cursor.fetchall()}
+            cursor.execute('COMMIT')
+        except Exception:
+            if conn.in_transaction:
+                cursor.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        for result in results:
+            key = result.pop('key', None)
+            if key is not None:
+                result['feedback_id'] = feedback_ids[key]
+        logger.info(f'Logged {len(feedback_rows)} feedback rows and {len(flag_rows)} flags in one batch')
+        return results
+
     def flag_interaction(self, interaction_id: int, flag_type: str, flag_reason: str) -> int:
         """Flag an interaction for review."""
         conn = sqlite3.connect(self.db_path)
@@ -84,4 +215,22 @@ class LLMMonitor:
         cursor.execute("\n            SELECT COUNT(*) \n            FROM flags f\n            JOIN interactions i ON f.interaction_id = i.id\n            WHERE i.timestamp >= datetime('now', ?)\n            ", (f'-{days} days',))
         flag_count = cursor.fetchone()[0]
         conn.close()
-        return {'total_count': total_count, 'avg_latency_ms': round(avg_latency, 2), 'avg_tokens_input': round(avg_tokens_input, 2), 'avg_tokens_output': round(avg_tokens_output, 2), 'avg_rating': round(avg_rating, 2) if avg_rating else None, 'flag_count': flag_count, 'days': days}
\ No newline at end of file
+        return {'total_count': total_count, 'avg_latency_ms': round(avg_latency, 2), 'avg_tokens_input': round(avg_tokens_input, 2), 'avg_tokens_output': round(avg_tokens_output, 2), 'avg_rating': round(avg_rating, 2) if avg_rating else None, 'flag_count': flag_count, 'days': days}
+
+    def ping(self) -> bool:
+        """Check that the monitoring database is reachable."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('SELECT 1 FROM interactions LIMIT 1')
+            conn.close()
+            return True
+        except sqlite3.Error as e:
+            logger.error(f'Monitoring database check failed: {str(e)}')
+            return False
+
+def get_monitor() -> LLMMonitor:
+    """Return the process-wide LLMMonitor, creating it (and its tables) on first use."""
+    global _monitor
+    if _monitor is None:
+        _monitor = LLMMonitor()
+    return _monitor
@@ -0,0 +1,106 @@
+"""
+Compares FTS5 interaction search against the `LIKE '%...%'` scans it replaces.
+
+Populates a throwaway monitoring database with synthetic interactions and feedback
+(the FTS triggers keep the index in sync during the load), then times a set of
+investigation queries both ways and reports the median latency per query. Both
+sides AND the query terms across prompt, response and feedback comments, and the
+script checks that they match the same number of rows.
+
+Usage:
+    python benchmarks/search_fts_vs_like.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.utils.monitoring import LLMMonitor
+TOPICS = ['password reset link expired', 'refund for annual subscription', 'invoice shows wrong billing address', 'two factor authentication code not arriving', 'upgrade from basic to pro plan', 'export data to csv', 'account locked after failed logins', 'cancel enterprise contract']
+FILLER = 'customer support assistant context question answer acme product help please thanks account order email'.split()
+QUERIES = ['refund', 'two factor', 'billing address', 'locked', 'export csv']
+
+def populate(db_path: str, rows: int):
+    """Bulk-load synthetic interactions and feedback through the monitored schema."""
+    monitor = LLMMonitor(db_path=db_path)
+    rng = random.Random(42)
+    start = datetime.now() - timedelta(days=30)
+    interactions = []
+    for i in range(rows):
+        topic = rng.choice(TOPICS)
+        words = ' '.join(rng.choices(FILLER, k=60))
+        interactions.append(((start + timedelta(seconds=i * 30)).isoformat(), f'session-{i % 5000}', 'customer_support', 'v1', f'USER QUESTION: {topic}? {words}', f'Here is how to handle {topic}. {words}', 200, 80, 900, rng.choice(['gpt-3.5-turbo', 'gpt-4']), 0.7, '{}'))
+    conn = sqlite3.connect(db_path)
+    conn.executemany('INSERT INTO interactions (timestamp, session_id, prompt_name, prompt_version, prompt_text, response_text, tokens_input, tokens_output, latency_ms, model, temperature, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', interactions)
+    feedback = [(i, rng.randint(1, 5), rng.choice(['did not mention the refund window', 'very helpful', 'wrong billing steps', '']), '[]', datetime.now().isoformat()) for i in range(1, rows + 1, 10)]
+    conn.executemany('INSERT INTO feedback (interaction_id, rating, comment, categories, timestamp) VALUES (?, ?, ?, ?, ?)', feedback)
+    conn.commit()
+    conn.close()
+    return monitor
+
+def like_filter(query: str):
+    """WHERE clause matching every term somewhere in the row, mirroring FTS5's implicit AND."""
+    clauses = []
+    params = []
+    for term in query.split():
+        pattern = f'%{term}%'
+        clauses.append('(i.prompt_text LIKE ? OR i.response_text LIKE ? OR i.id IN (SELECT f.interaction_id FROM feedback f WHERE f.comment LIKE ?))')
+        params.extend([pattern, pattern, pattern])
+    return (' AND '.join(clauses), params)
+
+def like_search(db_path: str, query: str, limit: int=20):
+    """The previous approach: substring scans over every text column."""
+    where, params = like_filter(query)
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute(f'SELECT i.id FROM interactions i WHERE {where} ORDER BY i.timestamp DESC LIMIT ?', params + [limit])
+    rows = cursor.fetchall()
+    conn.close()
+    return rows
+
+def match_counts(db_path: str, query: str):
+    """Number of rows each approach matches, to confirm both sides do the same work."""
+    where, params = like_filter(query)
+    match = ' '.join((f'"{term}"' for term in query.split()))
+    conn = sqlite3.connect(db_path)
+    like_count = conn.execute(f'SELECT COUNT(*) FROM interactions i WHERE {where}', params).fetchone()[0]
+    fts_count = conn.execute('SELECT COUNT(*) FROM interactions_fts WHERE interactions_fts MATCH ?', (match,)).fetchone()[0]
+    conn.close()
+    return (like_count, fts_count)
+
+def timed(fn, repeat: int) -> float:
+    """Median wall time of `fn` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main():
+    """main - Loads the synthetic dataset and prints LIKE vs FTS5 latencies."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'bench.db')
+        start = time.perf_counter()
+        monitor = populate(db_path, args.rows)
+        print(f'loaded {args.rows} interactions in {time.perf_counter() - start:.1f}s ({os.path.getsize(db_path) / 1e6:.1f} MB)')
+        print(f"{'query':<16}  {'matches':>8}  {'LIKE ms':>9}  {'FTS5 ms':>9}  {'speedup':>8}")
+        for query in QUERIES:
+            like_count, fts_count = match_counts(db_path, query)
+            if like_count != fts_count:
+                raise RuntimeError(f'{query!r}: LIKE matched {like_count} rows but FTS5 matched {fts_count}')
+            like_ms = timed(lambda: like_search(db_path, query), args.repeat)
+            fts_ms = timed(lambda: monitor.search_interactions(query), args.repeat)
+            print(f'{query:<16}  {like_count:>8}  {like_ms:>9.1f}  {fts_ms:>9.1f}  {like_ms / fts_ms:>7.1f}x')
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Replays a multi-turn support conversation to measure input tokens per turn.
+
+Compares two strategies for carrying conversation state:
+  - client-side: the client resends the whole transcript in `context` every turn
+    (the behaviour before the server-side session store existed);
+  - session store: the server builds `messages` from a rolling summary plus the
+    most recent turns via `SessionStore.build_messages`.
+
+No LLM calls are made; assistant replies are synthesized from the knowledge base
+and tokens are counted with `estimate_tokens` (tiktoken is used when installed).
+
+Usage:
+    python benchmarks/session_token_savings.py [--turns N] [--sessions N]
+"""
+
+import argparse
+import json
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from app.prompts.templates import CUSTOMER_SUPPORT_TEMPLATE
+from app.services.llm_service import SYSTEM_MESSAGE
+from app.services.session_store import SessionStore, estimate_tokens
+
+def get_counter():
+    """Use tiktoken for exact counts when available, else the store's estimate."""
+    try:
+        import tiktoken
+    except ImportError:
+        return (estimate_tokens, 'estimate (~4 chars/token)')
+    encoding = tiktoken.get_encoding('cl100k_base')
+    return (lambda text: len(encoding.encode(text)), 'tiktoken cl100k_base')
+
+def build_workload(turns: int):
+    """Synthesize (question, answer) pairs cycling through the KB articles."""
+    with open('data/kb/support_articles.json', 'r') as f:
+        articles = json.load(f)
+    workload = []
+    for i in range(turns):
+        article = articles[i % len(articles)]
+        question = f"Follow-up {i + 1}: can you explain more about {article['title'].lower()}? I tried what you said but it did not work."
+        answer = f"Sure. {article['content']} If that still does not help, please contact support and mention reference #{1000 + i}."
+        workload.append((question, answer))
+    return workload
+
+def count_messages(messages, count) -> int:
+    """Token count of a chat `messages` payload, with a small per-message overhead."""
+    return sum((count(m['content']) + 4 for m in messages))
+
+def main():
+    """main - Replays the workload under both strategies and prints per-turn input tokens."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--turns', type=int, default=20)
+    parser.add_argument('--sessions', type=int, default=50)
+    args = parser.parse_args()
+    count, counter_name = get_counter()
+    workload = build_workload(args.turns)
+    store = SessionStore(db_path=None)
+    baseline = [0] * args.turns
+    with_store = [0] * args.turns
+    for s in range(args.sessions):
+        session_id = f'bench-{s}'
+        transcript = []
+        for t, (question, answer) in enumerate(workload):
+            context = '\n'.join(transcript) or 'No specific context provided.'
+            prompt = CUSTOMER_SUPPORT_TEMPLATE.format(context=context, question=question)
+            baseline[t] += count_messages([{'role': 'system', 'content': SYSTEM_MESSAGE}, {'role': 'user', 'content': prompt}], count)
+            transcript.extend([f'User: {question}', f'Assistant: {answer}'])
+            prompt = CUSTOMER_SUPPORT_TEMPLATE.format(context='No specific context provided.', question=question)
+            with_store[t] += count_messages(store.build_messages(session_id, SYSTEM_MESSAGE, prompt), count)
+            store.append_turn(session_id, question, answer)
+    print(f'token counter: {counter_name}  sessions: {args.sessions}  turns: {args.turns}')
+    print(f"{'turn':>4}  {'client-side':>11}  {'session store':>13}")
+    for t in range(args.turns):
+        print(f'{t + 1:>4}  {baseline[t] // args.sessions:>11}  {with_store[t] // args.sessions:>13}')
+    total_baseline, total_store = (sum(baseline), sum(with_store))
+    print(f'\ntotal input tokens: client-side {total_baseline}  session store {total_store}  saved {100 * (1 - total_store / total_baseline):.1f}%')
+    print(f'store occupancy: {store.stats()}')
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Measures cold-start import cost of the API using `python -X importtime`.
+
+Runs a fresh interpreter that imports the target module (default `app.main`),
+parses the importtime report from stderr, and prints the total cumulative
+import time, the target module's own cumulative time and its slowest direct
+imports. Use it to compare startup cost before and after changes to the
+module graph.
+
+Usage:
+    python benchmarks/startup_importtime.py [module] [--runs N] [--top N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+def run_importtime(module: str) -> List[Tuple[int, int, str]]:
+    """Import `module` in a fresh interpreter and return (self_us, cumulative_us, name) rows."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ['']
+        raise RuntimeError(f'Importing {module} failed: {tail[0]}')
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+def depth(name: str) -> int:
+    """Nesting level of an importtime row (0 for imports made directly by `-c`)."""
+    return (len(name) - len(name.lstrip()) - 1) // 2
+
+def summarize(rows: List[Tuple[int, int, str]], module: str, top: int) -> Dict[str, object]:
+    """Total import time, the target module's own cost and its slowest direct imports.
+
+    importtime prints a module after everything it imports, so the direct children of
+    `module` are the depth-1 rows between the previous depth-0 row and `module` itself.
+    """
+    total_us = 0
+    target_us = 0
+    block: List[Tuple[int, str]] = []
+    children: List[Tuple[int, str]] = []
+    for _, cumulative, name in rows:
+        level = depth(name)
+        if level == 1:
+            block.append((cumulative, name.strip()))
+        if level != 0:
+            continue
+        total_us += cumulative
+        if name.strip() == module:
+            target_us = cumulative
+            children = block
+        block = []
+    return {'total_us': total_us, 'target_us': target_us, 'modules': len(rows), 'slowest': sorted(children, reverse=True)[:top]}
+
+def main():
+    """main - Parses arguments and reports median startup import time."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('module', nargs='?', default='app.main')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+    summaries = [summarize(run_importtime(args.module), args.module, args.top) for _ in range(args.runs)]
+    totals = [s['total_us'] for s in summaries]
+    targets = [s['target_us'] for s in summaries]
+    print(f'module: {args.module}  runs: {args.runs}  modules imported: {summaries[-1]["modules"]}')
+    print(f'total import time: median {statistics.median(totals) / 1000:.1f} ms  min {min(totals) / 1000:.1f} ms  max {max(totals) / 1000:.1f} ms')
+    print(f'{args.module}: median {statistics.median(targets) / 1000:.1f} ms')
+    print(f'\nslowest direct imports of {args.module} (last run):')
+    for cumulative, name in summaries[-1]['slowest']:
+        print(f'  {cumulative / 1000:8.1f} ms  {name}')
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,7 @@ submits feedback, and retrieves performance metrics.
 
 import requests
 import json
+import uuid
 BASE_URL = 'http://localhost:8000'
 
 def test_chat():
@@ -44,8 +45,58 @@ def test_metrics():
         print(json.dumps(data, indent=2))
     else:
         print(f'Error: {response.status_code} - {response.text}')
+
+def test_health_probes():
+    """Liveness and readiness probes both report OK once startup has finished."""
+    print('\nTesting health probes...')
+    live = requests.get(f'{BASE_URL}/health/live')
+    ready = requests.get(f'{BASE_URL}/health/ready')
+    print(f'Liveness: {live.status_code} - {live.text}')
+    print(f'Readiness: {ready.status_code} - {ready.text}')
+    assert live.status_code == 200
+    assert ready.status_code == 200
+
+def test_session_follow_up():
+    """Input tokens stay bounded over a long session once older turns are summarized."""
+    print('\nTesting session follow-up...')
+    session_id = f'test-session-{uuid.uuid4()}'
+    questions = ['Which plan includes priority support?', 'How much does that plan cost?', 'How much storage does it include?', 'Can I upgrade from Basic to it?', 'How do I reset my password?', 'How long is the reset link valid?', 'What happens if the link expires?', 'Who do I contact if that still fails?']
+    tokens_input = []
+    for question in questions:
+        response = requests.post(f'{BASE_URL}/chat/', json={'question': question, 'session_id': session_id})
+        assert response.status_code == 200, response.text
+        tokens_input.append(response.json()['tokens_input'])
+    print(f'Input tokens per turn: {tokens_input}')
+    # Once the history passes SESSION_SUMMARY_THRESHOLD_TOKENS (800 by default) only a capped
+    # summary plus the last two turns (at most 500 output tokens each) are replayed.
+    assert max(tokens_input) < tokens_input[0] + 1600
+
+def test_search():
+    """Full-text search finds the interaction logged by the chat test."""
+    print('\nTesting interaction search...')
+    response = requests.get(f'{BASE_URL}/interactions/search', params={'q': 'reset password', 'limit': 5})
+    if response.status_code == 200:
+        print(json.dumps(response.json(), indent=2))
+    else:
+        print(f'Error: {response.status_code} - {response.text}')
+
+def test_bulk_feedback(interaction_id):
+    """Bulk NDJSON upload reports created, duplicate and invalid rows per line."""
+    print('\nTesting bulk feedback endpoint...')
+    lines = [json.dumps({'interaction_id': interaction_id, 'rating': 2, 'comment': 'Missed the refund window'}), json.dumps({'interaction_id': interaction_id, 'rating': 4}), json.dumps({'interaction_id': interaction_id, 'rating': 9})]
+    response = requests.post(f'{BASE_URL}/feedback/bulk', params={'source': f'test-sync-{uuid.uuid4()}'}, data='\n'.join(lines), headers={'Content-Type': 'application/x-ndjson'})
+    assert response.status_code == 200, response.text
+    data = response.json()
+    print(json.dumps(data, indent=2))
+    assert [r['status'] for r in data['results']] == ['created', 'duplicate', 'error']
+    assert data['results'][0]['flagged'] is True
+    assert (data['created'], data['duplicates'], data['errors']) == (1, 1, 1)
 if __name__ == '__main__':
+    test_health_probes()
     chat_result = test_chat()
+    test_session_follow_up()
     if chat_result:
         test_feedback(chat_result['interaction_id'])
-    test_metrics()
\ No newline at end of file
+        test_bulk_feedback(chat_result['interaction_id'])
+    test_metrics()
+    test_search()
\ No newline at end of file